@@ -1,14 +1,17 @@
+from datetime import date
 from typing import Dict, Any, List
-from tools.weather_tool import WeatherTool
+from tools.weather_tool import WeatherTool, resolve_date
 from tools.news_tool import NewsTool
+from tools.stale_cache import StaleWhileRevalidateTool
 
 class ExecutorAgent:
     """
     Agent responsible for executing the steps in the plan.
     """
     def __init__(self):
-        self.weather_tool = WeatherTool()
-        self.news_tool = NewsTool()
+        # Serve last-known-good results while upstream APIs are slow or down
+        self.weather_tool = StaleWhileRevalidateTool(WeatherTool())
+        self.news_tool = StaleWhileRevalidateTool(NewsTool())
         self.tools = {
             "WeatherTool": self.weather_tool,
             "NewsTool": self.news_tool
@@ -41,6 +44,12 @@ class ExecutorAgent:
             action = step.get("action")
             args = step.get("args", {})
             
+            # WeatherTool answers for the plan's date, resolved to an absolute day so
+            # cached results for "Tomorrow" are not reused after midnight
+            if tool_name == "WeatherTool" and context["date"]:
+                resolved = resolve_date(context["date"], date.today())
+                args = {**args, "date": resolved.isoformat() if resolved else context["date"]}
+            
             if tool_name in self.tools:
                 print(f"[Executor] Running {tool_name} with args: {args}")
                 tool = self.tools[tool_name]
@@ -1,4 +1,7 @@
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, Any
 from llm.llm_client import LLMClient
 from tools.rss_tool import RSSTool
@@ -8,10 +11,72 @@ class VerifierAgent:
     """
     Agent responsible for validating results and providing the final recommendation.
     Handles fallback to RSS if necessary.
+    Reuses a previous recommendation when the compacted inputs are unchanged.
     """
-    def __init__(self):
+    def __init__(self, max_cached_recommendations: int = 256):
         self.llm = LLMClient()
         self.rss_tool = RSSTool()
+        self.max_cached_recommendations = max_cached_recommendations
+        self._recommendations: "OrderedDict[str, FinalRecommendation]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def compact_inputs(context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce the verifier inputs to the parts that can change the recommendation.
+
+        Weather values are rounded to meaningful precision and news is reduced to
+        the set of article IDs, so cosmetic differences between API responses
+        (float noise, reordering, cache age markers) map to the same inputs.
+
+        Args:
+            context (Dict): The context from the Executor, after any RSS fallback.
+
+        Returns:
+            Dict: Compact, JSON-serializable representation of the inputs.
+        """
+        results = context.get("results", {})
+
+        weather = results.get("fetch_weather", {})
+        if "error" in weather:
+            compact_weather = {"error": True}
+        else:
+            compact_weather = {
+                "condition": str(weather.get("condition", "")).strip().lower(),
+                "temperature": _round_to(weather.get("temperature"), 1),
+                "temp_min": _round_to(weather.get("temp_min"), 1),
+                "temp_max": _round_to(weather.get("temp_max"), 1),
+                "humidity": _round_to(weather.get("humidity"), 5),
+                "wind_speed": _round_to(weather.get("wind_speed"), 1),
+            }
+
+        article_ids = set()
+        for action in ("fetch_news", "fetch_news_fallback"):
+            for article in results.get(action, {}).get("articles", []) or []:
+                article_id = article.get("link") or article.get("title")
+                if article_id:
+                    article_ids.add(article_id)
+
+        # Distinguish "no news available" from "news fetched, nothing relevant"
+        news_error = all(
+            "error" in results.get(action, {"error": True})
+            for action in ("fetch_news", "fetch_news_fallback")
+        )
+
+        return {
+            "destination": str(context.get("destination", "")).strip().lower(),
+            "date": context.get("date"),
+            "weather": compact_weather,
+            "article_ids": sorted(article_ids),
+            "news_error": news_error,
+        }
+
+    @classmethod
+    def fingerprint(cls, context: Dict[str, Any]) -> str:
+        """Return a stable hash of the compacted verifier inputs."""
+        compact = cls.compact_inputs(context)
+        payload = json.dumps(compact, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def verify_and_respond(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -34,6 +99,16 @@ class VerifierAgent:
             rss_query = f"{destination} travel safety"
             rss_result = self.rss_tool.execute(query=rss_query)
             results["fetch_news_fallback"] = rss_result
+
+        # Skip LLM synthesis if the meaningful inputs have not changed
+        fingerprint = self.fingerprint(context)
+        with self._lock:
+            cached = self._recommendations.get(fingerprint)
+            if cached is not None:
+                self._recommendations.move_to_end(fingerprint)
+        if cached is not None:
+            print("[Verifier] Inputs unchanged, reusing previous recommendation.")
+            return cached.dict()
             
         # Synthesize with LLM
         final_prompt = f"""
@@ -74,6 +149,7 @@ class VerifierAgent:
             
             # Validate with Pydantic
             validated_response = FinalRecommendation(**final_dict)
+            self._remember(fingerprint, validated_response)
             return validated_response.dict()
             
         except json.JSONDecodeError as e:
@@ -88,3 +164,18 @@ class VerifierAgent:
                 "error": f"Verification validation failed: {str(e)}",
                 "raw_output": response_text
             }
+
+    def _remember(self, fingerprint: str, recommendation: FinalRecommendation):
+        """Store a recommendation, evicting the least recently used beyond the limit."""
+        with self._lock:
+            self._recommendations[fingerprint] = recommendation
+            self._recommendations.move_to_end(fingerprint)
+            while len(self._recommendations) > self.max_cached_recommendations:
+                self._recommendations.popitem(last=False)
+
+
+def _round_to(value: Any, step: float) -> Any:
+    """Round a numeric value to the nearest multiple of step; pass other values through."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    return round(value / step) * step
@@ -1,8 +1,10 @@
 import streamlit as st
 import json
+import uuid
 from agents.planner import PlannerAgent
 from agents.executor import ExecutorAgent
 from agents.verifier import VerifierAgent
+from jobs.job_queue import JobQueue
 
 # Page config
 st.set_page_config(
@@ -22,6 +24,48 @@ def get_agents():
 
 planner, executor, verifier = get_agents()
 
+@st.cache_resource
+def get_job_queue():
+    return JobQueue()
+
+def show_recommendation(final_result):
+    """Render the Verifier's final recommendation."""
+    st.markdown("---")
+    st.markdown("### 📊 Final Recommendation")
+
+    # Pretty display of result
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.metric("🌍 Destination", final_result.get("destination", "N/A"))
+        st.metric("📅 Date", final_result.get("date", "N/A"))
+        st.metric("🎯 Travel Score", f"{final_result.get('travel_score', 0)}/10")
+
+    with col2:
+        weather = final_result.get("weather", {})
+        if weather:
+            st.metric("🌡️ Temperature", f"{weather.get('temperature', 'N/A')}°C")
+            st.info(f"☁️ {weather.get('condition', 'N/A')}")
+
+    # Alerts
+    alerts = final_result.get("alerts", [])
+    # Ensure alerts is a list (not a string being iterated char-by-char)
+    if isinstance(alerts, str):
+        alerts = [alerts] if alerts else []
+
+    if alerts:
+        st.markdown("#### ⚠️ Important Alerts")
+        for alert in alerts:
+            st.warning(alert)
+
+    # Recommendation
+    st.markdown("#### 💡 Recommendation")
+    st.success(final_result.get("recommendation", "No recommendation available"))
+
+    # JSON output
+    with st.expander("📄 Raw JSON Output"):
+        st.json(final_result)
+
 # Input section
 st.markdown("### 🔍 Ask Your Travel Safety Question")
 query = st.text_input(
@@ -29,12 +73,21 @@ query = st.text_input(
     placeholder="e.g., Is it safe to travel to Mumbai tomorrow?",
     label_visibility="collapsed"
 )
+run_in_background = st.checkbox(
+    "Run in background queue (requires workers: `python main.py --worker`)"
+)
 
 # Process button
 if st.button("🚀 Get Recommendation", type="primary"):
     if not query:
         st.warning("⚠️ Please enter a query first!")
+    elif run_in_background:
+        # Key on session + query so repeated clicks don't queue duplicate in-flight jobs
+        session_key = st.session_state.setdefault("session_key", uuid.uuid4().hex)
+        job_key = f"{session_key}:{query.strip().lower()}"
+        st.session_state["job_id"] = get_job_queue().submit(query, job_key=job_key)
     else:
+        st.session_state.pop("job_id", None)
         with st.spinner("🧠 AI is analyzing your query..."):
             # Step 1: Planning
             st.info("**Step 1/3:** 🧠 Planner Agent analyzing query...")
@@ -59,42 +112,33 @@ if st.button("🚀 Get Recommendation", type="primary"):
                 final_result = verifier.verify_and_respond(tool_results)
                 st.success("✅ Recommendation ready!")
                 
-                # Display final result
-                st.markdown("---")
-                st.markdown("### 📊 Final Recommendation")
-                
-                # Pretty display of result
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric("🌍 Destination", final_result.get("destination", "N/A"))
-                    st.metric("📅 Date", final_result.get("date", "N/A"))
-                    st.metric("🎯 Travel Score", f"{final_result.get('travel_score', 0)}/10")
-                
-                with col2:
-                    weather = final_result.get("weather", {})
-                    if weather:
-                        st.metric("🌡️ Temperature", f"{weather.get('temperature', 'N/A')}°C")
-                        st.info(f"☁️ {weather.get('condition', 'N/A')}")
-                
-                # Alerts
-                alerts = final_result.get("alerts", [])
-                # Ensure alerts is a list (not a string being iterated char-by-char)
-                if isinstance(alerts, str):
-                    alerts = [alerts] if alerts else []
-                
-                if alerts:
-                    st.markdown("#### ⚠️ Important Alerts")
-                    for alert in alerts:
-                        st.warning(alert)
-                
-                # Recommendation
-                st.markdown("#### 💡 Recommendation")
-                st.success(final_result.get("recommendation", "No recommendation available"))
-                
-                # JSON output
-                with st.expander("📄 Raw JSON Output"):
-                    st.json(final_result)
+                show_recommendation(final_result)
+
+# Background job status
+job_id = st.session_state.get("job_id")
+job = get_job_queue().get(job_id) if job_id else None
+if job_id and job is None:
+    # Job database was removed or JOB_DB_PATH changed
+    st.session_state.pop("job_id")
+    st.warning(f"⚠️ Background job {job_id} no longer exists. Please submit again.")
+elif job:
+    st.markdown("---")
+    st.markdown(f"### 📥 Background Job `{job['id']}`")
+    st.caption(f"Status: **{job['status']}** · Attempts: {job['attempts']} · "
+               f"Completed stages: {', '.join(job['stages_completed']) or 'none'}")
+
+    if job["status"] in ("done", "failed"):
+        # Only dedupe in-flight jobs: the next click after a finished job starts a new one
+        st.session_state["session_key"] = uuid.uuid4().hex
+
+    if job["status"] == "done":
+        show_recommendation(job["result"])
+    elif job["status"] == "failed":
+        st.error(f"❌ Job failed: {job['error']}")
+    else:
+        if job["error"]:
+            st.warning(f"⚠️ Retrying after error: {job['error']}")
+        st.button("🔄 Refresh Status")
 
 # Sidebar
 with st.sidebar:
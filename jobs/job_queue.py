@@ -0,0 +1,256 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    job_key TEXT UNIQUE,
+    query TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    visible_at REAL NOT NULL,
+    worker_id TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, visible_at);
+CREATE TABLE IF NOT EXISTS job_stages (
+    job_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    result TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (job_id, stage)
+);
+"""
+
+class JobQueue:
+    """
+    Durable local job queue backed by SQLite.
+
+    Jobs move through queued -> running -> done/failed. A claimed job stays
+    invisible to other workers for visibility_timeout seconds; if its worker
+    crashes, the job becomes claimable again. Completed pipeline stages are
+    checkpointed so a retried job resumes from the last finished stage.
+    """
+    def __init__(self, db_path: str = None, visibility_timeout: int = None, max_attempts: int = None):
+        self.db_path = db_path or os.getenv("JOB_DB_PATH", "jobs.db")
+        self.visibility_timeout = visibility_timeout or int(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300"))
+        self.max_attempts = max_attempts or int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection; safe to use from any thread or process."""
+        is_new = not os.path.exists(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if is_new:
+            # Also covers the database file being deleted while the queue is in use
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def submit(self, query: str, job_key: Optional[str] = None) -> str:
+        """
+        Enqueue a pipeline job.
+
+        Args:
+            query (str): The user's travel question.
+            job_key (str): Optional idempotency key. Submitting the same key again
+                returns the existing job instead of creating a new one. If that job
+                has failed, it is requeued from scratch under the same ID.
+
+        Returns:
+            str: The job ID.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR IGNORE INTO jobs (id, job_key, query, status, visible_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                    (job_id, job_key, query, now, now, now)
+                )
+                if job_key is not None:
+                    row = conn.execute("SELECT id, status FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+                    job_id = row["id"]
+                    if row["status"] == "failed":
+                        conn.execute(
+                            "UPDATE jobs SET status = 'queued', attempts = 0, error = NULL, result = NULL, "
+                            "worker_id = NULL, visible_at = ?, updated_at = ? WHERE id = ?",
+                            (now, now, job_id)
+                        )
+                        conn.execute("DELETE FROM job_stages WHERE job_id = ?", (job_id,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the job's status, result, error and completed stages, or None if unknown.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            stages = conn.execute(
+                "SELECT stage FROM job_stages WHERE job_id = ? ORDER BY completed_at", (job_id,)
+            ).fetchall()
+
+        return {
+            "id": row["id"],
+            "job_key": row["job_key"],
+            "query": row["query"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "stages_completed": [stage["stage"] for stage in stages],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"]
+        }
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically claim the next visible job for a worker.
+
+        Jobs whose visibility timeout expired (crashed worker) are reclaimed.
+        Jobs that already used max_attempts are marked failed instead.
+
+        Returns:
+            Dict: {"id", "query", "attempts"} of the claimed job, or None if the queue is empty.
+        """
+        with self._connect() as conn:
+            while True:
+                now = time.time()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT id, query, attempts FROM jobs "
+                        "WHERE status IN ('queued', 'running') AND visible_at <= ? "
+                        "ORDER BY created_at LIMIT 1",
+                        (now,)
+                    ).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+
+                    if row["attempts"] >= self.max_attempts:
+                        conn.execute(
+                            "UPDATE jobs SET status = 'failed', worker_id = NULL, updated_at = ?, "
+                            "error = 'Worker timed out (max attempts reached)' "
+                            "|| COALESCE('; previous error: ' || error, '') "
+                            "WHERE id = ?",
+                            (now, row["id"])
+                        )
+                        conn.execute("COMMIT")
+                        continue
+
+                    conn.execute(
+                        "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker_id = ?, "
+                        "visible_at = ?, updated_at = ? WHERE id = ?",
+                        (worker_id, now + self.visibility_timeout, now, row["id"])
+                    )
+                    conn.execute("COMMIT")
+                    return {"id": row["id"], "query": row["query"], "attempts": row["attempts"] + 1}
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+
+    def get_checkpoints(self, job_id: str) -> Dict[str, Any]:
+        """Return {stage: result} for every stage already completed for the job."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT stage, result FROM job_stages WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return {row["stage"]: json.loads(row["result"]) for row in rows}
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        Extend the worker's visibility timeout on a running job.
+
+        Returns:
+            bool: False if the worker no longer owns the job (it timed out and was reclaimed).
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET visible_at = ?, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (now + self.visibility_timeout, now, job_id, worker_id)
+            )
+        return cursor.rowcount > 0
+
+    def checkpoint(self, job_id: str, worker_id: str, stage: str, result: Dict[str, Any]) -> bool:
+        """
+        Store a completed stage result and extend the worker's visibility timeout.
+
+        Returns:
+            bool: False if the worker no longer owns the job (it timed out and was reclaimed).
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                "UPDATE jobs SET visible_at = ?, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (now + self.visibility_timeout, now, job_id, worker_id)
+            )
+            if cursor.rowcount == 0:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO job_stages (job_id, stage, result, completed_at) VALUES (?, ?, ?, ?)",
+                (job_id, stage, json.dumps(result), now)
+            )
+            conn.execute("COMMIT")
+        return True
+
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        """Mark the job done with its final result. Returns False if the worker lost ownership."""
+        return self._finish(job_id, worker_id, "done", result=json.dumps(result))
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Record a failed attempt. The job is retried after a backoff unless it has
+        used max_attempts, in which case it is marked failed.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is not None and row["attempts"] >= self.max_attempts:
+            return self._finish(job_id, worker_id, "failed", error=error)
+
+        # Exponential backoff between attempts, capped at the visibility timeout
+        attempts = row["attempts"] if row is not None else 1
+        backoff = min(2 ** attempts, self.visibility_timeout)
+        return self._finish(job_id, worker_id, "queued", error=error, visible_at=time.time() + backoff)
+
+    def _finish(self, job_id: str, worker_id: str, status: str, result: str = None,
+                error: str = None, visible_at: float = None) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = COALESCE(?, result), error = ?, "
+                "visible_at = COALESCE(?, visible_at), worker_id = NULL, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (status, result, error, visible_at, now, job_id, worker_id)
+            )
+        return cursor.rowcount > 0
@@ -0,0 +1,141 @@
+import os
+import time
+import socket
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from typing import Dict, Any
+from jobs.job_queue import JobQueue
+
+class PipelineWorker:
+    """
+    Worker that runs the Planner -> Executor -> Verifier pipeline for queued jobs.
+
+    Each stage result is checkpointed, so a job retried after a failure or a
+    crashed worker resumes from the last completed stage.
+    """
+    def __init__(self, queue: JobQueue, poll_interval: float = 1.0):
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._agents = None
+
+    @property
+    def agents(self):
+        """Create the agents lazily so they are built inside the worker process."""
+        if self._agents is None:
+            from agents.planner import PlannerAgent
+            from agents.executor import ExecutorAgent
+            from agents.verifier import VerifierAgent
+            self._agents = PlannerAgent(), ExecutorAgent(), VerifierAgent()
+        return self._agents
+
+    def run_forever(self):
+        """Claim and process jobs until interrupted."""
+        print(f"[Worker {self.worker_id}] Started.")
+        while True:
+            if not self.run_once():
+                time.sleep(self.poll_interval)
+
+    def run_once(self) -> bool:
+        """
+        Claim and process a single job.
+
+        Returns:
+            bool: True if a job was claimed, False if the queue was empty.
+        """
+        job = self.queue.claim(self.worker_id)
+        if job is None:
+            return False
+
+        print(f"[Worker {self.worker_id}] Processing job {job['id']} (attempt {job['attempts']})")
+        try:
+            self.process(job)
+        except Exception as e:
+            print(f"[Worker {self.worker_id}] Job {job['id']} failed: {e}")
+            self.queue.fail(job["id"], self.worker_id, str(e))
+        return True
+
+    def process(self, job: Dict[str, Any]):
+        """Run the remaining pipeline stages for a claimed job."""
+        planner, executor, verifier = self.agents
+        checkpoints = self.queue.get_checkpoints(job["id"])
+
+        stages = [
+            ("plan", lambda: planner.plan(job["query"])),
+            ("execute", lambda: executor.execute_plan(checkpoints["plan"])),
+            ("verify", lambda: verifier.verify_and_respond(checkpoints["execute"])),
+        ]
+
+        for stage, run in stages:
+            if stage in checkpoints:
+                continue
+
+            with self._keep_alive(job["id"]):
+                result = run()
+            if "error" in result:
+                # Planner/Verifier errors usually come from transient LLM failures; retry the stage
+                self.queue.fail(job["id"], self.worker_id, f"{stage} stage failed: {result['error']}")
+                return
+
+            if not self.queue.checkpoint(job["id"], self.worker_id, stage, result):
+                print(f"[Worker {self.worker_id}] Lost ownership of job {job['id']}, abandoning.")
+                return
+            checkpoints[stage] = result
+
+        self.queue.complete(job["id"], self.worker_id, checkpoints["verify"])
+
+    @contextmanager
+    def _keep_alive(self, job_id: str):
+        """
+        Renew the job's visibility timeout while a stage runs, so slow LLM or
+        tool calls are not mistaken for a crashed worker and rerun elsewhere.
+        """
+        self.queue.heartbeat(job_id, self.worker_id)
+        done = threading.Event()
+        interval = max(self.queue.visibility_timeout / 3, 1)
+
+        def renew():
+            while not done.wait(interval):
+                if not self.queue.heartbeat(job_id, self.worker_id):
+                    return
+
+        renewer = threading.Thread(target=renew, daemon=True)
+        renewer.start()
+        try:
+            yield
+        finally:
+            done.set()
+            renewer.join()
+
+
+def _worker_main(db_path: str):
+    PipelineWorker(JobQueue(db_path=db_path)).run_forever()
+
+
+def run_pool(processes: int = None, db_path: str = None):
+    """
+    Start a pool of worker processes and block until interrupted.
+
+    Args:
+        processes (int): Number of worker processes (defaults to the CPU count).
+        db_path (str): Path to the SQLite job database.
+    """
+    processes = processes or os.cpu_count() or 1
+    db_path = JobQueue(db_path=db_path).db_path
+
+    workers = [
+        multiprocessing.Process(target=_worker_main, args=(db_path,), daemon=True)
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    print(f"[Worker Pool] Running {processes} workers on {db_path}. Press Ctrl+C to stop.")
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        print("\n[Worker Pool] Stopping workers...")
+        for worker in workers:
+            worker.terminate()
@@ -4,12 +4,31 @@ import argparse
 from agents.planner import PlannerAgent
 from agents.executor import ExecutorAgent
 from agents.verifier import VerifierAgent
+from jobs.job_queue import JobQueue
+from jobs.worker import run_pool
 
 def main():
     parser = argparse.ArgumentParser(description="AI Smart Travel Ops Assistant")
     parser.add_argument("query", nargs="?", type=str, help="The travel query (e.g., 'Is it safe to travel to Delhi tomorrow?')")
+    parser.add_argument("--submit", action="store_true", help="Queue the query for background workers and print the job ID")
+    parser.add_argument("--key", type=str, help="Idempotency key for --submit (resubmitting returns the same job)")
+    parser.add_argument("--status", metavar="JOB_ID", type=str, help="Show the status/result of a queued job")
+    parser.add_argument("--worker", action="store_true", help="Run a pool of pipeline worker processes")
+    parser.add_argument("--processes", type=int, help="Number of worker processes for --worker (default: CPU count)")
     args = parser.parse_args()
 
+    if args.worker:
+        run_pool(processes=args.processes)
+        return
+
+    if args.status:
+        job = JobQueue().get(args.status)
+        if job is None:
+            print(f"❌ Unknown job: {args.status}")
+        else:
+            print(json.dumps(job, indent=2))
+        return
+
     user_query = args.query
     if not user_query:
         print("Please provide a query.")
@@ -19,6 +38,12 @@ def main():
     print(f"✈️  AI Smart Travel Ops Assistant")
     print(f"Query: {user_query}\n")
 
+    if args.submit:
+        job_id = JobQueue().submit(user_query, job_key=args.key)
+        print(f"📥 Job queued: {job_id}")
+        print(f"Check progress with: python main.py --status {job_id}")
+        return
+
     # 1. Planner Agent
     print("🧠 Planner Agent: Analyzing query...")
     planner = PlannerAgent()
@@ -1,53 +1,230 @@
+import os
+import re
+import threading
+import time
 import feedparser
-from typing import Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Set
 from tools.base_tool import BaseTool
 
+# Words that describe the kind of news wanted rather than the place it is about.
+# Local filtering ignores them when deciding whether an entry matches a destination.
+GENERIC_TERMS = {
+    "travel", "safety", "safe", "strike", "strikes", "protest", "protests",
+    "news", "alert", "alerts", "delay", "delays", "traffic", "or", "and", "in", "to"
+}
+
 class RSSTool(BaseTool):
     """
     Fallback tool to fetch news from RSS feeds when the main News API fails.
+
+    Supports two modes:
+    - "search": builds a Google News search feed per query (one fetch + parse per call).
+    - "ingest": fetches all global feeds concurrently on a schedule, parses each once,
+      and answers queries by filtering the in-memory entries.
     """
-    def __init__(self):
+    def __init__(self, mode: str = None, refresh_interval: int = None, retry_backoff: int = 60):
         self.feeds = {
             "google_news": "https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en",
             "bbc_world": "http://feeds.bbci.co.uk/news/world/rss.xml"
         }
+        self.mode = mode or os.getenv("RSS_MODE", "search")
+        self.refresh_interval = refresh_interval or int(os.getenv("RSS_REFRESH_SECONDS", "900"))
+
+        self._entries: List[Dict[str, Any]] = []
+        self._index: Dict[str, Set[int]] = {}
+        self._last_refresh = 0.0
+        self._last_attempt = 0.0
+        self.retry_backoff = retry_backoff
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._scheduler = None
+
+        if self.mode == "ingest":
+            self.start_ingestion()
+
+    @property
+    def global_feeds(self) -> Dict[str, str]:
+        """Feeds that do not depend on a query and can be shared by all destinations."""
+        return {name: url for name, url in self.feeds.items() if "{query}" not in url}
 
     def execute(self, query: str = "travel safety", **kwargs) -> Dict[str, Any]:
         """
         Fetch news from RSS feeds.
-        
+
         Args:
-            query (str): Search query for Google News RSS.
-            
+            query (str): Search query for Google News RSS, or filter terms in ingest mode.
+
         Returns:
             Dict: List of news items.
         """
+        if self.mode == "ingest":
+            return self._execute_ingested(query)
+
         try:
             # Prioritize Google News with specific query
             feed_url = self.feeds["google_news"].format(query=query)
             feed = feedparser.parse(feed_url)
-            
+
             if feed.bozo:
                 return {"error": f"Error parsing RSS feed: {feed.bozo_exception}"}
-                
+
             results = []
             for entry in feed.entries[:5]:
-                results.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "published": entry.get("published", "N/A"),
-                    "summary": entry.get("summary", "No summary available")
-                })
-                
+                results.append(self._simplify_entry(entry))
+
             return {
                 "status": "success",
                 "source": "RSS_Fallback",
                 "articles": results
             }
-            
+
+        except Exception as e:
+            return {"error": f"RSS Tool execution failed: {e}"}
+
+    def start_ingestion(self):
+        """Load the global feeds once and start the background refresh thread."""
+        if self._scheduler is not None:
+            return
+        self.refresh()
+        self._scheduler = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._scheduler.start()
+
+    def refresh(self, blocking: bool = True):
+        """
+        Fetch and parse every global feed concurrently, then swap in the new entries.
+
+        Args:
+            blocking (bool): If False, return immediately when another refresh is running.
+        """
+        if not self._refresh_lock.acquire(blocking=blocking):
+            return
+        try:
+            self._last_attempt = time.time()
+            self._refresh()
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self):
+        feeds = self.global_feeds
+        if not feeds:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(feeds)) as pool:
+            parsed = list(pool.map(self._fetch_feed, feeds.items()))
+
+        entries = [entry for feed_entries in parsed for entry in feed_entries]
+        if not entries and self._entries:
+            # Every feed failed; keep serving the previous snapshot
+            print("[RSSTool] Refresh returned no entries, keeping previous snapshot.")
+            return
+
+        # Inverted index: word -> positions of the entries containing it
+        index: Dict[str, Set[int]] = {}
+        for position, entry in enumerate(entries):
+            for word in entry["_words"]:
+                index.setdefault(word, set()).add(position)
+
+        with self._lock:
+            self._entries = entries
+            self._index = index
+            self._last_refresh = time.time()
+        print(f"[RSSTool] Ingested {len(entries)} entries from {len(feeds)} feeds.")
+
+    def _refresh_loop(self):
+        """Background loop that re-ingests the global feeds every refresh_interval seconds."""
+        while True:
+            time.sleep(self.refresh_interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[RSSTool] Scheduled refresh failed: {e}")
+
+    def _fetch_feed(self, feed: tuple) -> List[Dict[str, Any]]:
+        """Fetch and parse a single feed into simplified, pre-indexed entries."""
+        name, url = feed
+        try:
+            parsed = feedparser.parse(url)
+            if parsed.bozo and not parsed.entries:
+                print(f"[RSSTool] Error parsing feed '{name}': {parsed.bozo_exception}")
+                return []
+        except Exception as e:
+            print(f"[RSSTool] Failed to fetch feed '{name}': {e}")
+            return []
+
+        entries = []
+        for entry in parsed.entries:
+            item = self._simplify_entry(entry)
+            item["feed"] = name
+            # Tokenized once here so per-query filtering is a set membership check
+            item["_words"] = set(re.findall(r"\w+", f"{item['title']} {item['summary']}".lower()))
+            entries.append(item)
+        return entries
+
+    def _execute_ingested(self, query: str) -> Dict[str, Any]:
+        """Answer a query by filtering the in-memory entries."""
+        try:
+            if not self._entries and time.time() - self._last_attempt >= self.retry_backoff:
+                # No snapshot yet (e.g. first refresh failed). One caller retries per backoff
+                # window; the others get the error below and _refresh_loop keeps recovering.
+                self.refresh(blocking=False)
+
+            with self._lock:
+                entries = self._entries
+                index = self._index
+                last_refresh = self._last_refresh
+
+            if not entries:
+                return {"error": "RSS Tool has no ingested entries available."}
+
+            terms = re.findall(r"\w+", query.lower())
+            location_terms = [t for t in terms if t not in GENERIC_TERMS]
+            topic_terms = [t for t in terms if t in GENERIC_TERMS]
+
+            # Particles like "de" in "Rio de Janeiro" would match almost anything on their own
+            significant = [t for t in location_terms if len(t) > 2] or location_terms
+
+            # Whole-word matches, so "Oman" does not match "Woman". Entries must match at
+            # least one location term and rank by how many they match ("Paris, France").
+            if significant:
+                location_hits = Counter(
+                    position for t in set(significant) for position in index.get(t, ())
+                )
+            else:
+                location_hits = Counter(range(len(entries)))
+
+            matches = []
+            for position, hits in location_hits.items():
+                entry = entries[position]
+                score = sum(1 for t in topic_terms if t in entry["_words"])
+                matches.append(((hits, score, -position), entry))
+
+            matches.sort(key=lambda m: m[0], reverse=True)
+            results = [
+                {k: v for k, v in entry.items() if not k.startswith("_")}
+                for _, entry in matches[:5]
+            ]
+
+            return {
+                "status": "success",
+                "source": "RSS_Ingested",
+                "age_seconds": int(time.time() - last_refresh),
+                "articles": results
+            }
+
         except Exception as e:
             return {"error": f"RSS Tool execution failed: {e}"}
 
+    @staticmethod
+    def _simplify_entry(entry) -> Dict[str, Any]:
+        return {
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "published": entry.get("published", "N/A"),
+            "summary": entry.get("summary", "No summary available")
+        }
+
 if __name__ == "__main__":
     tool = RSSTool()
     print(tool.execute(query="Bangalore traffic"))
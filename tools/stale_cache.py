@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+from tools.base_tool import BaseTool
+
+class StaleWhileRevalidateTool(BaseTool):
+    """
+    Wraps a tool with a last-known-good cache keyed by its arguments.
+
+    - Fresh results (younger than fresh_ttl) are served from the cache.
+    - Older results are served immediately, marked stale with their age,
+      while a background refresh fetches a new one.
+    - If the upstream call fails, the last known-good result is served instead
+      of the error, as long as it is not older than max_staleness.
+    """
+    def __init__(self, tool: BaseTool, fresh_ttl: int = None, max_staleness: int = None,
+                 max_entries: int = 512):
+        self.tool = tool
+        self.max_entries = max_entries
+        self.fresh_ttl = fresh_ttl if fresh_ttl is not None else int(os.getenv("TOOL_FRESH_TTL_SECONDS", "300"))
+        self.max_staleness = max_staleness if max_staleness is not None else int(os.getenv("TOOL_MAX_STALENESS_SECONDS", "3600"))
+
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        """
+        Execute the wrapped tool, serving cached results according to the staleness policy.
+
+        Args:
+            **kwargs: Arguments forwarded to the wrapped tool (e.g. city, query).
+
+        Returns:
+            Dict: Tool result, with "stale" and "age_seconds" set when served from an old entry.
+        """
+        key = self._make_key(kwargs)
+        entry = self._get_entry(key)
+
+        if entry is not None:
+            stored_at, result = entry
+            age = time.time() - stored_at
+            if age < self.fresh_ttl:
+                return result
+            self._refresh_in_background(key, kwargs)
+            return self._mark_stale(result, age)
+
+        return self._fetch(key, kwargs)
+
+    def _fetch(self, key: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the wrapped tool and store the result if it succeeded."""
+        try:
+            result = self.tool.execute(**kwargs)
+        except Exception as e:
+            result = {"error": str(e)}
+
+        if "error" not in result:
+            with self._lock:
+                self._cache[key] = (time.time(), result)
+                self._cache.move_to_end(key)
+                # Evict the least recently used entries beyond the limit
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _refresh_in_background(self, key: Tuple, kwargs: Dict[str, Any]):
+        """Start a refresh for key unless one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                result = self._fetch(key, kwargs)
+                if "error" in result:
+                    print(f"[{type(self.tool).__name__}] Background refresh failed: {result['error']}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _get_entry(self, key: Tuple):
+        """Return the cached (stored_at, result) pair, dropping it if past max_staleness."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] > self.max_staleness:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def _make_key(kwargs: Dict[str, Any]) -> Tuple:
+        return tuple(sorted(
+            (name, value.strip().lower() if isinstance(value, str) else repr(value))
+            for name, value in kwargs.items()
+        ))
+
+    @staticmethod
+    def _mark_stale(result: Dict[str, Any], age: float) -> Dict[str, Any]:
+        return {**result, "stale": True, "age_seconds": int(age)}
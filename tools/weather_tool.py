@@ -1,6 +1,13 @@
 import os
+import re
+import time
+import threading
+import calendar
 import requests
-from typing import Dict, Any
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from datetime import date as date_type, datetime, timedelta, timezone
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 from tools.base_tool import BaseTool
 from tools.retry_utils import api_retry
@@ -10,18 +17,36 @@ load_dotenv()
 class WeatherTool(BaseTool):
     """
     Tool to fetch weather data from OpenWeatherMap.
+
+    Supports two modes:
+    - "current": current conditions only, one API call per query.
+    - "forecast": the 5-day / 3-hour forecast is fetched once per city, kept as a
+      compact time-indexed array, and future dates in the window are answered
+      locally. Today is answered from current conditions.
     """
-    def __init__(self):
+    def __init__(self, mode: str = None, forecast_ttl: int = None, max_cities: int = 256):
         self.api_key = os.getenv("OPENWEATHER_API_KEY")
         self.base_url = "http://api.openweathermap.org/data/2.5/weather"
+        self.forecast_url = "http://api.openweathermap.org/data/2.5/forecast"
+        self.mode = mode or os.getenv("WEATHER_MODE", "forecast")
+        self.forecast_ttl = forecast_ttl or int(os.getenv("WEATHER_FORECAST_TTL_SECONDS", "1800"))
+
+        self.max_cities = max_cities
+
+        # city -> {"lock": per-city fetch lock, "forecast": cached forecast or None}
+        self._cities: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
 
-    def execute(self, city: str, **kwargs) -> Dict[str, Any]:
+    def execute(self, city: str, date: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
-        Fetch current weather for a specific city with retry logic.
-        
+        Fetch weather for a specific city with retry logic.
+
         Args:
             city (str): The name of the city.
-            
+            date (str): Travel date in YYYY-MM-DD format or 'Today'/'Tomorrow'.
+                Only used in forecast mode; defaults to today. Unrecognized dates
+                fall back to current conditions.
+
         Returns:
             Dict: Weather data or error message.
         """
@@ -29,7 +54,21 @@ class WeatherTool(BaseTool):
             return {"error": "Missing OPENWEATHER_API_KEY in environment variables."}
 
         try:
-            return self._fetch_weather_with_retry(city)
+            if self.mode == "forecast" and resolve_date(date, date_type.today()) is not None:
+                forecast = self._get_forecast(city)
+                tz = timezone(timedelta(seconds=forecast["tz_offset"]))
+                # Relative dates are resolved against the city's local today
+                today = datetime.now(tz).date()
+                target = resolve_date(date, today)
+                if target > today:
+                    return self._slice_forecast(forecast, target)
+                return self._current_with_forecast(city, forecast, target, today)
+
+            result = self._fetch_weather_with_retry(city)
+            if self.mode == "forecast":
+                # Unrecognized date (e.g. "next week"): current conditions beat no weather at all
+                result["note"] = f"Could not resolve date '{date}'; showing current conditions."
+            return result
         except Exception as err:
             print(f"[WeatherTool] All retry attempts failed: {err}")
             return {"error": f"Weather API failed after retries: {err}"}
@@ -44,9 +83,9 @@ class WeatherTool(BaseTool):
         }
         response = requests.get(self.base_url, params=params, timeout=10)
         response.raise_for_status()
-        
+
         data = response.json()
-        
+
         # Simplified output for the agent
         return {
             "status": "success",
@@ -57,7 +96,137 @@ class WeatherTool(BaseTool):
             "wind_speed": data["wind"]["speed"]
         }
 
+    def _get_forecast(self, city: str) -> Dict[str, Any]:
+        """Return the cached forecast for a city, fetching it at most once per TTL."""
+        key = city.strip().lower()
+        with self._lock:
+            slot = self._cities.get(key)
+            if slot is None:
+                slot = self._cities[key] = {"lock": threading.Lock(), "forecast": None}
+            self._cities.move_to_end(key)
+            # Evict the least recently used cities, along with their locks
+            while len(self._cities) > self.max_cities:
+                self._cities.popitem(last=False)
+
+        # Concurrent requests for the same city wait for a single upstream call
+        with slot["lock"]:
+            forecast = slot["forecast"]
+            if forecast is None or time.time() - forecast["fetched_at"] > self.forecast_ttl:
+                forecast = slot["forecast"] = self._fetch_forecast_with_retry(city)
+            return forecast
+
+    @api_retry
+    def _fetch_forecast_with_retry(self, city: str) -> Dict[str, Any]:
+        """Fetch the multi-day forecast and store it as parallel time-indexed arrays."""
+        params = {
+            "q": city,
+            "appid": self.api_key,
+            "units": "metric"  # Celsius
+        }
+        response = requests.get(self.forecast_url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = response.json()
+        slots = sorted(data.get("list", []), key=lambda slot: slot["dt"])
+        if not slots:
+            raise ValueError(f"Forecast API returned no data for {city}")
+
+        return {
+            "city": data.get("city", {}).get("name", city),
+            "tz_offset": data.get("city", {}).get("timezone", 0),
+            "fetched_at": time.time(),
+            "times": [slot["dt"] for slot in slots],
+            "temperature": [slot["main"]["temp"] for slot in slots],
+            "humidity": [slot["main"]["humidity"] for slot in slots],
+            "wind_speed": [slot["wind"]["speed"] for slot in slots],
+            "condition": [slot["weather"][0]["description"] for slot in slots]
+        }
+
+    def _current_with_forecast(self, city: str, forecast: Dict[str, Any],
+                               target: date_type, today: date_type) -> Dict[str, Any]:
+        """
+        Answer for the city's today with current conditions, widening the
+        min/max with today's remaining forecast slots.
+
+        The forecast starts at the next 3-hour slot, so it cannot describe "now"
+        and late in the evening has no slots left for today at all.
+        """
+        result = self._fetch_weather_with_retry(city)
+        result["date"] = today.isoformat()
+
+        start = calendar.timegm(today.timetuple()) - forecast["tz_offset"]
+        lo = bisect_left(forecast["times"], start)
+        hi = bisect_left(forecast["times"], start + 86400)
+        temps = [result["temperature"]] + forecast["temperature"][lo:hi]
+        result["temp_min"] = min(temps)
+        result["temp_max"] = max(temps)
+
+        if target != today:
+            result["requested_date"] = target.isoformat()
+            result["note"] = f"No forecast for past date {target.isoformat()}; showing current conditions."
+        return result
+
+    def _slice_forecast(self, forecast: Dict[str, Any], target: date_type) -> Dict[str, Any]:
+        """
+        Summarize the forecast slots that fall on the target local date.
+
+        Dates outside the forecast window are answered with the nearest covered
+        day, labelled with the requested date and a note.
+        """
+        tz = timezone(timedelta(seconds=forecast["tz_offset"]))
+        times = forecast["times"]
+        first = datetime.fromtimestamp(times[0], tz).date()
+        last = datetime.fromtimestamp(times[-1], tz).date()
+        day = min(max(target, first), last)
+
+        # Bounds of the day in UTC epoch seconds
+        start = calendar.timegm(day.timetuple()) - forecast["tz_offset"]
+        lo = bisect_left(times, start)
+        hi = bisect_left(times, start + 86400)
+
+        temps = forecast["temperature"][lo:hi]
+        result = {
+            "status": "success",
+            "city": forecast["city"],
+            "date": day.isoformat(),
+            "temperature": round(sum(temps) / len(temps), 1),
+            "temp_min": min(temps),
+            "temp_max": max(temps),
+            "condition": Counter(forecast["condition"][lo:hi]).most_common(1)[0][0],
+            "humidity": round(sum(forecast["humidity"][lo:hi]) / (hi - lo)),
+            "wind_speed": max(forecast["wind_speed"][lo:hi])
+        }
+        if day != target:
+            result["requested_date"] = target.isoformat()
+            result["note"] = (f"No forecast for {target.isoformat()}; "
+                              f"showing nearest covered day {day.isoformat()}.")
+        return result
+
+
+def resolve_date(date: Optional[str], today: date_type) -> Optional[date_type]:
+    """
+    Map a plan date to an absolute date.
+
+    Accepts 'Today'/'Tomorrow', YYYY-MM-DD, or a string containing one
+    (e.g. a range like '2026-10-25 to 2026-10-27', which resolves to its start).
+
+    Returns:
+        date: The resolved date, or None if it cannot be determined.
+    """
+    if not date or date.strip().lower() == "today":
+        return today
+    if date.strip().lower() == "tomorrow":
+        return today + timedelta(days=1)
+    match = re.search(r"\d{4}-\d{2}-\d{2}", date)
+    if match:
+        try:
+            return datetime.strptime(match.group(), "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    return None
+
 if __name__ == "__main__":
     # Test the tool locally
     tool = WeatherTool()
     print(tool.execute(city="London"))
+    print(tool.execute(city="London", date="Tomorrow"))